@@ -3,88 +3,155 @@ Helper script to identify explicit custom fields from FRD requirements
 This helps ensure all explicit custom fields are identified before generating the data model
 """
 
+import functools
 import pandas as pd
 import re
+import sys
 from pathlib import Path
 
 
+# Precompiled patterns (compiled once at import, not per row/call)
+
+# Catalog field names (format: "- Field Name (fieldName)")
+_OOTB_PAT1 = re.compile(r'- [^(]+\((\w+)\)')
+# Field names in field group descriptions
+_OOTB_PAT2 = re.compile(r'(\w+)\s*\[(?:Text|Lookup|Date|Boolean|Integer|Double|Clob)')
+
+# All explicit field mention patterns unioned into a single alternation so
+# each requirement description is scanned exactly once. Named groups identify
+# which class of field matched, so no per-mention substring scan is needed.
+_FIELD_RE = re.compile(
+    r'(?ix)'
+    r'\b(?:(?P<cwid>cwid)|(?P<pidm>pidm)|(?P<classification>classification))\b'
+    r'|source\s+(?:system\s+)?(?:(?P<address>address)|(?P<phone>phone)|(?P<email>email))\s+id'
+    r'|unique\s+(?:primary\s+)?key\s+(?:value\s+)?for\s+(?:each\s+)?'
+    r'(?:(?P<address2>address)|(?P<phone2>phone)|(?P<email2>email))'
+    r'|constituent\s+(?:type|role)'
+    r'|employee\s+(?P<classification2>classification)'
+)
+
+# Group-free variant for the vectorized prefilter (pandas str.contains warns
+# when the pattern captures groups it would discard)
+_FIELD_RE_PREFILTER = re.compile(re.sub(r'\(\?P<\w+>', '(?:', _FIELD_RE.pattern))
+
+# Matched group name → canonical field name (None means no mappable field)
+_GROUP_TO_FIELD = {
+    'cwid': 'cwid',
+    'pidm': 'pidm',
+    'classification': 'classification',
+    'classification2': 'classification',
+    'address': 'sourceAddressId',
+    'address2': 'sourceAddressId',
+    'phone': 'sourcePhoneId',
+    'phone2': 'sourcePhoneId',
+    'email': 'sourceEmailId',
+    'email2': 'sourceEmailId',
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_ootb_cached(path_str, mtime_ns, size):
+    """Parse the OOTB catalog file (memoized per path + mtime/size)"""
+    # read_bytes + decode skips the BufferedReader/TextIOWrapper layers that
+    # read_text sets up for a file we slurp whole anyway
+    ootb_text = Path(path_str).read_bytes().decode('utf-8')
+
+    ootb_fields = set()
+
+    # Extract field names from catalog (format: "- Field Name (fieldName)")
+    # Interned names make the later membership checks pointer-fast, and the
+    # frozenset is safe to share from the lru_cache
+    ootb_fields.update(sys.intern(m) for m in _OOTB_PAT1.findall(ootb_text))
+
+    # Also extract from field group descriptions
+    ootb_fields.update(sys.intern(m) for m in _OOTB_PAT2.findall(ootb_text))
+
+    return frozenset(ootb_fields)
+
+
 def load_ootb_field_names():
     """Load all OOTB Person field names from the catalog"""
-    ootb_fields = set()
-    
     # Try to load from ootb_person_reference.txt
     candidates = [
         Path('ootb_person_reference.txt'),
         Path(__file__).resolve().parent.parent / 'ootb_person_reference.txt',
     ]
-    
-    ootb_text = ""
+
     for path in candidates:
-        if path.exists():
-            try:
-                ootb_text = path.read_text(encoding='utf-8')
-                break
-            except Exception:
-                pass
-    
-    if not ootb_text:
-        print("⚠️  Warning: Could not load OOTB catalog")
-        return ootb_fields
-    
-    # Extract field names from catalog (format: "- Field Name (fieldName)")
-    pattern = r'- [^(]+\((\w+)\)'
-    matches = re.findall(pattern, ootb_text)
-    ootb_fields.update(matches)
-    
-    # Also extract from field group descriptions
-    pattern2 = r'(\w+)\s*\[(?:Text|Lookup|Date|Boolean|Integer|Double|Clob)'
-    matches2 = re.findall(pattern2, ootb_text)
-    ootb_fields.update(matches2)
-    
-    return ootb_fields
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        try:
+            # Keyed on mtime/size so an updated catalog invalidates the cache
+            return _load_ootb_cached(str(path), st.st_mtime_ns, st.st_size)
+        except Exception:
+            pass
+
+    print("⚠️  Warning: Could not load OOTB catalog")
+    return frozenset()
+
+
+def _open_excel_fast(excel_path):
+    """Open a workbook with the Rust-based calamine engine, falling back to openpyxl
+
+    calamine parses the XLSX XML natively (roughly 2x faster); when
+    python-calamine is not installed, openpyxl in read_only mode skips
+    formatting/styles for the next-best load time.
+    """
+    try:
+        return pd.ExcelFile(excel_path, engine='calamine')
+    # pandas < 2.2 raises ValueError ("Unknown engine") instead of ImportError
+    except (ImportError, ValueError):
+        return pd.ExcelFile(excel_path, engine='openpyxl',
+                            engine_kwargs={'read_only': True})
+
+
+def _scan_descriptions(descs):
+    """Boolean mask of descriptions containing an explicit field mention"""
+    return descs.str.contains(_FIELD_RE_PREFILTER, regex=True)
 
 
 def extract_explicit_fields_from_frd(excel_path):
-    """Extract explicit field mentions from FRD requirements"""
-    excel_data = pd.read_excel(excel_path, sheet_name=None, engine='openpyxl')
-    
-    if 'Functional Requirements' not in excel_data:
-        return []
-    
-    df = excel_data['Functional Requirements']
-    explicit_fields = []
-    
-    # Common patterns for explicit field mentions
-    field_patterns = [
-        r'\b(CWID|cwid|CWID)\b',
-        r'\b(PIDM|pidm|PIDM)\b',
-        r'\b(Classification|classification)\b',
-        r'source\s+(?:system\s+)?(?:address|phone|email)\s+id',
-        r'unique\s+(?:primary\s+)?key\s+(?:value\s+)?for\s+(?:each\s+)?(address|phone|email)',
-        r'constituent\s+(?:type|role)',
-        r'employee\s+classification',
-    ]
-    
-    for idx, row in df.iterrows():
-        fr_num = row.get('FR #', '')
-        desc = str(row.get('Functional Requirements Description', ''))
-        
-        if pd.isna(fr_num) or pd.isna(desc):
-            continue
-        
-        # Check for explicit field mentions
-        for pattern in field_patterns:
-            matches = re.finditer(pattern, desc, re.IGNORECASE)
-            for match in matches:
-                field_context = desc[max(0, match.start()-50):match.end()+50]
-                explicit_fields.append({
-                    'requirementId': str(fr_num),
-                    'fieldMention': match.group(),
-                    'context': field_context.strip(),
-                    'fullRequirement': desc[:200]
-                })
-    
-    return explicit_fields
+    """Yield explicit field mentions from FRD requirements
+
+    Generator so consumers stream through matches without a full list of
+    match dicts being held in memory first.
+    """
+    # Probe the sheet names first (cheap - no cell data is parsed), then read
+    # only the one sheet and two columns consumed below
+    with _open_excel_fast(excel_path) as xl:
+        if 'Functional Requirements' not in xl.sheet_names:
+            return
+        try:
+            df = xl.parse(
+                'Functional Requirements',
+                usecols=['FR #', 'Functional Requirements Description']
+            )
+        except ValueError:
+            # An expected column is missing
+            return
+
+    # Normalize both columns once (string coercion and NaN handling happen in
+    # a single vectorized pass, not per row), then let pandas scan every
+    # description - only the (few) matching rows fall back to Python
+    fr_nums = df['FR #'].astype('string').fillna('')
+    descs = df['Functional Requirements Description'].astype('string').fillna('')
+
+    valid = (fr_nums != '') & (descs != '')
+    matched = valid & _scan_descriptions(descs)
+
+    for fr_num, desc in zip(fr_nums[matched].to_numpy(), descs[matched].to_numpy()):
+        # Check for explicit field mentions (single pass per description)
+        for match in _FIELD_RE.finditer(desc):
+            field_context = desc[max(0, match.start()-50):match.end()+50]
+            yield {
+                'requirementId': fr_num,
+                'fieldMention': match.group(0),
+                'canonicalField': _GROUP_TO_FIELD.get(match.lastgroup),
+                'context': field_context.strip(),
+                'fullRequirement': desc[:200]
+            }
 
 
 def identify_custom_fields(excel_path):
@@ -100,53 +167,49 @@ def identify_custom_fields(excel_path):
     print(f"   Found {len(ootb_fields)} OOTB fields")
     print()
     
-    # Extract explicit fields from FRD
+    # Extract explicit fields from FRD and identify custom fields in one
+    # streaming pass (the extractor is a generator)
     print("🔍 Scanning FRD requirements for explicit field mentions...")
-    explicit_fields = extract_explicit_fields_from_frd(excel_path)
-    print(f"   Found {len(explicit_fields)} explicit field mentions")
-    print()
-    
-    # Identify custom fields
     print("🎯 Identifying custom fields (not in OOTB)...")
     print()
-    
+
+    # Collect per-match lines and emit them in one write - avoids a stdout
+    # flush per match inside the hot loop
+    out_lines = []
     custom_fields = []
-    for field_info in explicit_fields:
-        field_name = field_info['fieldMention'].lower()
-        
-        # Map mentions to actual field names
-        field_mapping = {
-            'cwid': 'cwid',
-            'pidm': 'pidm',
-            'classification': 'classification',
-            'address': 'sourceAddressId',
-            'phone': 'sourcePhoneId',
-            'email': 'sourceEmailId',
-        }
-        
-        actual_field_name = None
-        for key, value in field_mapping.items():
-            if key in field_name:
-                actual_field_name = value
-                break
-        
+    seen = set()
+    mention_count = 0
+    for field_info in extract_explicit_fields_from_frd(excel_path):
+        mention_count += 1
+        # Canonical name was resolved from the matched regex group upstream
+        actual_field_name = field_info['canonicalField']
+
         if actual_field_name and actual_field_name not in ootb_fields:
+            # Report each (field, requirement) pair once even when the same
+            # mention repeats inside one description
+            key = (actual_field_name, sys.intern(field_info['requirementId']))
+            if key in seen:
+                continue
+            seen.add(key)
             custom_fields.append({
                 'fieldName': actual_field_name,
                 'requirementId': field_info['requirementId'],
                 'context': field_info['context'],
                 'fullRequirement': field_info['fullRequirement']
             })
-            print(f"   ✅ {actual_field_name:25} (FR{field_info['requirementId']}) - CUSTOM FIELD REQUIRED")
-            print(f"      Context: {field_info['context'][:80]}...")
+            out_lines.append(f"   ✅ {actual_field_name:25} (FR{field_info['requirementId']}) - CUSTOM FIELD REQUIRED")
+            out_lines.append(f"      Context: {field_info['context'][:80]}...")
         elif actual_field_name:
-            print(f"   ℹ️  {actual_field_name:25} (FR{field_info['requirementId']}) - Found in OOTB")
-    
+            out_lines.append(f"   ℹ️  {actual_field_name:25} (FR{field_info['requirementId']}) - Found in OOTB")
+
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines) + "\n")
+
     print()
     print("=" * 70)
     print("SUMMARY")
     print("=" * 70)
-    print(f"Total explicit field mentions: {len(explicit_fields)}")
+    print(f"Total explicit field mentions: {mention_count}")
     print(f"Custom fields required: {len(custom_fields)}")
     print()
     
@@ -4,6 +4,9 @@ Convert JSON data model to Draw.io format and HTML report
 """
 
 import json
+from functools import lru_cache
+from html import escape
+from itertools import chain
 from typing import Dict, List
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
@@ -26,11 +29,14 @@ def generate_drawio(data_model: Dict) -> str:
         Draw.io XML string
     """
     
-    # Extract entities from dataModel section
+    # Extract entities from dataModel section. validate_data_model has
+    # already guaranteed name/type/fields on every entity and name/dataType
+    # on every field, so those keys are read with direct subscripts below;
+    # .get stays only for genuinely optional keys
     entities = data_model.get('dataModel', {}).get('entities', [])
     
     # Filter to only show Business Entities
-    business_entities = [e for e in entities if e.get('type') == 'BusinessEntity']
+    business_entities = [e for e in entities if e['type'] == 'BusinessEntity']
     
     # ============================================
     # LAYOUT CONSTANTS - Matching Aswin_shared.drawio
@@ -160,18 +166,18 @@ def generate_drawio(data_model: Dict) -> str:
     max_expanded_per_group = 0
     
     for entity in business_entities:
-        fields = entity.get('fields', [])
+        fields = entity['fields']
         field_groups_in_entity = {}
         
         for field in fields:
             fg = field.get('fieldGroup')
             if fg and fg != '_meta':
-                if fg not in field_groups_in_entity:
-                    field_groups_in_entity[fg] = 0
-                field_groups_in_entity[fg] += 1
+                # Single-lookup upsert instead of a membership test plus a
+                # second subscript on the same key
+                field_groups_in_entity[fg] = field_groups_in_entity.get(fg, 0) + 1
             else:
                 total_standalone_fields += 1
-        
+
         total_field_groups += len(field_groups_in_entity)
         
         # For each field group, we need vertical space for all its expanded fields
@@ -182,14 +188,12 @@ def generate_drawio(data_model: Dict) -> str:
     # Each field group takes up space = max(1, number of expanded fields) * FIELD_SPACING
     total_rows = total_standalone_fields
     for entity in business_entities:
-        fields = entity.get('fields', [])
+        fields = entity['fields']
         field_groups_in_entity = {}
         for field in fields:
             fg = field.get('fieldGroup')
             if fg and fg != '_meta':
-                if fg not in field_groups_in_entity:
-                    field_groups_in_entity[fg] = 0
-                field_groups_in_entity[fg] += 1
+                field_groups_in_entity[fg] = field_groups_in_entity.get(fg, 0) + 1
         for fg_name, fg_count in field_groups_in_entity.items():
             total_rows += max(1, fg_count)
     
@@ -294,8 +298,8 @@ def generate_drawio(data_model: Dict) -> str:
     current_field_y = FIELD_Y_START
     
     for entity_idx, entity in enumerate(business_entities):
-        entity_name = entity.get('name', 'Entity')
-        fields = entity.get('fields', [])
+        entity_name = entity['name']
+        fields = entity['fields']
         
         # Create entity header (blue box)
         entity_id = get_next_id()
@@ -312,9 +316,9 @@ def generate_drawio(data_model: Dict) -> str:
         for field in fields:
             fg = field.get('fieldGroup')
             if fg and fg != '_meta':
-                if fg not in field_groups_dict:
-                    field_groups_dict[fg] = []
-                field_groups_dict[fg].append(field)
+                # setdefault resolves the key once instead of a membership
+                # test plus a second subscript
+                field_groups_dict.setdefault(fg, []).append(field)
             else:
                 standalone_fields.append(field)
         
@@ -323,7 +327,7 @@ def generate_drawio(data_model: Dict) -> str:
         # ============================================
         
         for field in standalone_fields:
-            field_name = field.get('name', 'field')
+            field_name = field['name']
             field_style = get_field_style(field)
             is_lookup = field.get('isLookup', False)
             
@@ -386,7 +390,7 @@ def generate_drawio(data_model: Dict) -> str:
             expanded_y = group_y
             
             for group_field in group_fields:
-                field_name = group_field.get('name', 'field')
+                field_name = group_field['name']
                 is_lookup = group_field.get('isLookup', False)
                 group_field_style = get_field_style(group_field)
                 # Create expanded field box (add spacingRight for lookup fields to make room for icon)
@@ -453,133 +457,110 @@ def save_drawio_file(data_model: Dict, output_path: str = "data_model.drawio"):
     print(f"📊 Open this file in Draw.io (https://app.diagrams.net)")
 
 
-def generate_html_report(data_model: Dict, output_path: str = "data_model_report.html") -> str:
-    """
-    Generate interactive HTML report with entity details and traceability
-    
-    Args:
-        data_model: Parsed data model dictionary
-        output_path: Path to save HTML file
-    
-    Returns:
-        HTML string
-    """
-    
-    metadata = data_model.get('metadata', {})
-    reasoning = data_model.get('reasoning', {})
-    entities = data_model.get('dataModel', {}).get('entities', [])
-    relationships = data_model.get('dataModel', {}).get('relationships', [])
-    
-    # Get stats
-    stats = get_summary_stats(data_model)
-    
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Model Report - {metadata.get('generatedDate', 'N/A')}</title>
-    <style>
-        * {{
+# Static report chrome, built once at import: the stylesheet contains no
+# interpolation (the braces in the f-string were all escaped literals)
+# and the closing markup/script never changes
+_REPORT_CSS = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
             background: #f5f5f5;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 12px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.1em;
             opacity: 0.9;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 30px 40px;
             background: #f8f9fa;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.05);
             text-align: center;
-        }}
+        }
         
-        .stat-card .number {{
+        .stat-card .number {
             font-size: 2.5em;
             font-weight: bold;
             color: #667eea;
             display: block;
-        }}
+        }
         
-        .stat-card .label {{
+        .stat-card .label {
             color: #666;
             font-size: 0.9em;
             margin-top: 5px;
-        }}
+        }
         
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 50px;
-        }}
+        }
         
-        .section-title {{
+        .section-title {
             font-size: 1.8em;
             margin-bottom: 20px;
             color: #333;
             border-bottom: 3px solid #667eea;
             padding-bottom: 10px;
-        }}
+        }
         
-        .entity-card {{
+        .entity-card {
             background: white;
             border: 2px solid #e0e0e0;
             border-radius: 12px;
             margin-bottom: 30px;
             overflow: hidden;
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
+        }
         
-        .entity-card:hover {{
+        .entity-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
+        }
         
-        .entity-header {{
+        .entity-header {
             background: #667eea;
             color: white;
             padding: 20px 30px;
@@ -587,209 +568,209 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
+        }
         
-        .entity-header h3 {{
+        .entity-header h3 {
             font-size: 1.5em;
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
         
-        .entity-type-badge {{
+        .entity-type-badge {
             background: rgba(255,255,255,0.2);
             padding: 5px 15px;
             border-radius: 20px;
             font-size: 0.7em;
             font-weight: normal;
-        }}
+        }
         
-        .toggle-icon {{
+        .toggle-icon {
             font-size: 1.5em;
             transition: transform 0.3s;
-        }}
+        }
         
-        .entity-card.collapsed .toggle-icon {{
+        .entity-card.collapsed .toggle-icon {
             transform: rotate(-90deg);
-        }}
+        }
         
-        .entity-body {{
+        .entity-body {
             padding: 30px;
             display: block;
-        }}
+        }
         
-        .entity-card.collapsed .entity-body {{
+        .entity-card.collapsed .entity-body {
             display: none;
-        }}
+        }
         
-        .entity-description {{
+        .entity-description {
             color: #666;
             margin-bottom: 25px;
             padding: 15px;
             background: #f8f9fa;
             border-left: 4px solid #667eea;
             border-radius: 4px;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
-        }}
+        }
         
-        th {{
+        th {
             background: #f8f9fa;
             padding: 12px;
             text-align: left;
             font-weight: 600;
             color: #333;
             border-bottom: 2px solid #e0e0e0;
-        }}
+        }
         
-        td {{
+        td {
             padding: 12px;
             border-bottom: 1px solid #f0f0f0;
-        }}
+        }
         
-        tr:hover {{
+        tr:hover {
             background: #f8f9fa;
-        }}
+        }
         
-        .field-name {{
+        .field-name {
             font-weight: 600;
             color: #333;
-        }}
+        }
         
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 0.85em;
             font-weight: 500;
-        }}
+        }
         
-        .badge-ootb {{
+        .badge-ootb {
             background: #d4edda;
             color: #155724;
-        }}
+        }
         
-        .badge-custom {{
+        .badge-custom {
             background: #f8cecc;
             color: #b85450;
-        }}
+        }
         
-        tr.custom-field-row {{
+        tr.custom-field-row {
             background: #f8cecc !important;
-        }}
+        }
         
-        tr.custom-field-row:hover {{
+        tr.custom-field-row:hover {
             background: #f5b8b5 !important;
-        }}
+        }
         
-        .badge-required {{
+        .badge-required {
             background: #f8d7da;
             color: #721c24;
-        }}
+        }
         
-        .badge-lookup {{
+        .badge-lookup {
             background: #d1ecf1;
             color: #0c5460;
-        }}
+        }
         
-        .badge-group {{
+        .badge-group {
             background: #e7f3ff;
             color: #004085;
-        }}
+        }
         
-        .traceability {{
+        .traceability {
             margin-top: 15px;
             padding: 10px;
             background: #fffbf0;
             border-left: 3px solid #ffc107;
             border-radius: 4px;
             font-size: 0.9em;
-        }}
+        }
         
-        .traceability-title {{
+        .traceability-title {
             font-weight: 600;
             color: #856404;
             margin-bottom: 5px;
-        }}
+        }
         
-        .requirement {{
+        .requirement {
             color: #666;
             margin-left: 10px;
             display: block;
-        }}
+        }
         
-        .reasoning-section {{
+        .reasoning-section {
             background: #f0f4ff;
             padding: 25px;
             border-radius: 8px;
             margin-top: 20px;
-        }}
+        }
         
-        .reasoning-title {{
+        .reasoning-title {
             font-weight: 600;
             color: #667eea;
             margin-bottom: 10px;
             font-size: 1.1em;
-        }}
+        }
         
-        .reasoning-text {{
+        .reasoning-text {
             color: #555;
             line-height: 1.8;
-        }}
+        }
         
-        .brd-reference {{
+        .brd-reference {
             background: white;
             padding: 15px;
             border-radius: 6px;
             margin-top: 10px;
             border-left: 3px solid #667eea;
-        }}
+        }
         
-        .brd-reference-title {{
+        .brd-reference-title {
             font-weight: 600;
             color: #667eea;
             font-size: 0.9em;
             margin-bottom: 5px;
-        }}
+        }
         
-        .brd-reference-text {{
+        .brd-reference-text {
             color: #666;
             font-style: italic;
-        }}
+        }
         
-        .metadata-section {{
+        .metadata-section {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .metadata-item {{
+        .metadata-item {
             display: flex;
             padding: 10px 0;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        .metadata-item:last-child {{
+        .metadata-item:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .metadata-label {{
+        .metadata-label {
             font-weight: 600;
             color: #666;
             width: 150px;
-        }}
+        }
         
-        .metadata-value {{
+        .metadata-value {
             color: #333;
             flex: 1;
-        }}
+        }
         
-        .search-box {{
+        .search-box {
             width: 100%;
             padding: 12px 20px;
             border: 2px solid #e0e0e0;
@@ -797,26 +778,140 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
             font-size: 1em;
             margin-bottom: 20px;
             transition: border-color 0.3s;
-        }}
+        }
         
-        .search-box:focus {{
+        .search-box:focus {
             outline: none;
             border-color: #667eea;
-        }}
+        }
         
-        .no-results {{
+        .no-results {
             text-align: center;
             padding: 40px;
             color: #999;
             font-size: 1.2em;
-        }}
-    </style>
+        }
+    </style>"""
+
+_REPORT_FOOTER = """
+                </div>
+                <div id="noResults" class="no-results" style="display: none;">
+                    No entities or fields match your search.
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <script>
+        function toggleEntity(header) {
+            const card = header.parentElement;
+            card.classList.toggle('collapsed');
+        }
+        
+        function filterEntities() {
+            const searchTerm = document.getElementById('searchBox').value.toLowerCase();
+            const entities = document.querySelectorAll('.entity-card');
+            let visibleCount = 0;
+            
+            entities.forEach(entity => {
+                const entityName = entity.getAttribute('data-entity-name');
+                const text = entity.textContent.toLowerCase();
+                
+                if (text.includes(searchTerm)) {
+                    entity.style.display = 'block';
+                    visibleCount++;
+                } else {
+                    entity.style.display = 'none';
+                }
+            });
+            
+            document.getElementById('noResults').style.display = visibleCount === 0 ? 'block' : 'none';
+        }
+    </script>
+</body>
+</html>
+"""
+
+
+# Data types, field groups and lookup targets draw from a small vocabulary
+# repeated across every field; memoizing their escape turns the repeat
+# renders into cache hits
+_escape_cached = lru_cache(maxsize=256)(escape)
+
+
+def _entity_card_open(entity_name, type_badge, description, header_style=''):
+    """Opening markup for an entity card (shared by both entity sections)"""
+    return f"""
+                    <div class="entity-card" data-entity-name="{escape(entity_name.lower(), quote=True)}">
+                        <div class="entity-header" onclick="toggleEntity(this)"{header_style}>
+                            <h3>
+                                {escape(entity_name)}
+                                <span class="entity-type-badge">{type_badge}</span>
+                            </h3>
+                            <span class="toggle-icon">▼</span>
+                        </div>
+                        <div class="entity-body">
+                            <div class="entity-description">
+                                {description}
+                            </div>
+"""
+
+
+def generate_html_report(data_model: Dict, output_path: str = "data_model_report.html") -> str:
+    """
+    Generate interactive HTML report with entity details and traceability
+    
+    Args:
+        data_model: Parsed data model dictionary
+        output_path: Path to save HTML file
+    
+    Returns:
+        HTML string
+    """
+
+    # Stream each chunk to disk as soon as it is generated (same pattern as
+    # the prompt writer in cursor_workflow), so emitted bytes leave memory
+    # promptly instead of waiting on the fully assembled document
+    parts = []
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for chunk in _iter_html_report(data_model):
+            f.write(chunk)
+            parts.append(chunk)
+
+    print(f"✅ HTML report saved to: {output_path}")
+    print(f"📄 Open this file in your browser to view the report")
+
+    # Joined once, for callers that consume the returned document
+    return ''.join(parts)
+
+
+def _iter_html_report(data_model: Dict):
+    """Yield the HTML report as chunks, in document order"""
+
+    metadata = data_model.get('metadata') or {}
+    reasoning = data_model.get('reasoning') or {}
+    entities = data_model.get('dataModel', {}).get('entities', [])
+    relationships = data_model.get('dataModel', {}).get('relationships', [])
+    
+    # Get stats
+    stats = get_summary_stats(data_model)
+
+    # Accumulate chunks and join once at the end - appending to a growing
+    # str re-copies the whole document on every +=, which is quadratic in
+    # total bytes for large models
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Data Model Report - {escape(metadata.get('generatedDate') or 'N/A')}</title>
+{_REPORT_CSS}
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>📊 Data Model Report</h1>
-            <p>Generated on {metadata.get('generatedDate', 'N/A')} • Platform: {metadata.get('platform', 'informatica').title()}</p>
+            <p>Generated on {escape(metadata.get('generatedDate') or 'N/A')} • Platform: {escape((metadata.get('platform') or 'informatica').title())}</p>
         </div>
         
         <div class="stats">
@@ -853,11 +948,11 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
                 <div class="metadata-section">
                     <div class="metadata-item">
                         <span class="metadata-label">Platform:</span>
-                        <span class="metadata-value">{metadata.get('platform', 'informatica').title()}</span>
+                        <span class="metadata-value">{escape((metadata.get('platform') or 'informatica').title())}</span>
                     </div>
                     <div class="metadata-item">
                         <span class="metadata-label">Generated Date:</span>
-                        <span class="metadata-value">{metadata.get('generatedDate', 'N/A')}</span>
+                        <span class="metadata-value">{escape(metadata.get('generatedDate') or 'N/A')}</span>
                     </div>
                 </div>
             </div>
@@ -867,7 +962,7 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
                 <h2 class="section-title">🧠 AI Reasoning</h2>
                 <div class="reasoning-section">
                     <div class="reasoning-title">Summary</div>
-                    <div class="reasoning-text">{reasoning.get('summary', 'No reasoning provided')}</div>
+                    <div class="reasoning-text">{escape(reasoning.get('summary') or 'No reasoning provided')}</div>
                 </div>
             </div>
             
@@ -878,51 +973,55 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
                 <div id="entitiesContainer">
 """
     
-    # Generate entity cards
-    business_entities = [e for e in entities if e.get('type') == 'BusinessEntity']
-    
+    # Partition the entity list in one pass; both sections below reuse it
+    business_entities = []
+    reference_entities = []
+    for e in entities:
+        if e['type'] == 'BusinessEntity':
+            business_entities.append(e)
+        elif e['type'] == 'ReferenceEntity':
+            reference_entities.append(e)
+
+    # Index the reasoning decisions once, so the loops below do a dict
+    # lookup per entity/field instead of scanning the decision lists every
+    # time. setdefault keeps the first decision on duplicates, matching the
+    # next() scans this replaces.
+    entity_decisions = {}
+    for decision in reasoning.get('entityDecisions') or ():
+        entity_decisions.setdefault(decision.get('entityName'), decision)
+    field_decisions = {}
+    for decision in reasoning.get('fieldDecisions') or ():
+        field_decisions.setdefault(
+            (decision.get('entityName'), decision.get('fieldName')), decision)
+
     for entity in business_entities:
-        entity_name = entity.get('name', 'Entity')
-        entity_type = entity.get('type', 'BusinessEntity')
-        entity_description = entity.get('description', 'No description provided')
-        fields = entity.get('fields', [])
+        entity_name = entity['name']
+        # Escape once at assignment; the raw values stay available for the
+        # reasoning lookups below
+        entity_type = escape(entity.get('type') or 'BusinessEntity')
+        entity_description = escape(entity.get('description') or 'No description provided')
+        fields = entity['fields']
         
         # Find entity reasoning
-        entity_reasoning = next(
-            (er for er in reasoning.get('entityDecisions', []) if er.get('entityName') == entity_name),
-            {}
-        )
+        entity_reasoning = entity_decisions.get(entity_name, {})
         
-        html += f"""
-                    <div class="entity-card" data-entity-name="{entity_name.lower()}">
-                        <div class="entity-header" onclick="toggleEntity(this)">
-                            <h3>
-                                {entity_name}
-                                <span class="entity-type-badge">{entity_type}</span>
-                            </h3>
-                            <span class="toggle-icon">▼</span>
-                        </div>
-                        <div class="entity-body">
-                            <div class="entity-description">
-                                {entity_description}
-                            </div>
-"""
+        yield _entity_card_open(entity_name, entity_type, entity_description)
         
         # Entity reasoning
         if entity_reasoning:
-            html += f"""
+            yield f"""
                             <div class="reasoning-section">
                                 <div class="reasoning-title">Why this entity?</div>
-                                <div class="reasoning-text">{entity_reasoning.get('reason', 'N/A')}</div>
+                                <div class="reasoning-text">{escape(entity_reasoning.get('reason') or 'N/A')}</div>
                                 <div class="brd-reference">
                                     <div class="brd-reference-title">BRD Reference:</div>
-                                    <div class="brd-reference-text">"{entity_reasoning.get('brdReference', 'N/A')}"</div>
+                                    <div class="brd-reference-text">"{escape(entity_reasoning.get('brdReference') or 'N/A')}"</div>
                                 </div>
                             </div>
 """
         
         # Fields table
-        html += """
+        yield """
                             <table>
                                 <thead>
                                     <tr>
@@ -937,23 +1036,19 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
 """
         
         for field in fields:
-            field_name = field.get('name', 'field')
-            data_type = field.get('dataType', 'N/A')
-            field_group = field.get('fieldGroup', '-')
+            field_name = field['name']
+            data_type = _escape_cached(field.get('dataType') or 'N/A')
+            field_group = _escape_cached(field.get('fieldGroup') or '-')
             is_custom = field.get('isCustom', False)
             is_required = field.get('isRequired', False)
             is_lookup = field.get('isLookup', False)
-            lookup_entity = field.get('lookupEntity', '')
-            description = field.get('description', '')
-            requirement_ids = field.get('requirementIds', [])
-            source_requirements = field.get('sourceRequirements', [])
+            lookup_entity = _escape_cached(field.get('lookupEntity') or '')
+            description = escape(field.get('description') or '')
+            requirement_ids = field.get('requirementIds') or ()
+            source_requirements = field.get('sourceRequirements') or ()
             
             # Find field reasoning
-            field_reasoning = next(
-                (fr for fr in reasoning.get('fieldDecisions', []) 
-                 if fr.get('entityName') == entity_name and fr.get('fieldName') == field_name),
-                {}
-            )
+            field_reasoning = field_decisions.get((entity_name, field_name), {})
             
             # Build properties badges
             properties = []
@@ -974,9 +1069,9 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
             properties_html = ' '.join(properties)
             row_class = ' class="custom-field-row"' if is_custom else ''
             
-            html += f"""
+            yield f"""
                                     <tr{row_class}>
-                                        <td class="field-name">{field_name}</td>
+                                        <td class="field-name">{escape(field_name)}</td>
                                         <td>{data_type}</td>
                                         <td>{field_group}</td>
                                         <td>{properties_html}</td>
@@ -986,41 +1081,41 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
             
             # Traceability
             if requirement_ids or source_requirements:
-                html += """
+                yield """
                                             <div class="traceability">
                                                 <div class="traceability-title">📎 Requirement Traceability:</div>
 """
                 for req_id, req_text in zip(requirement_ids, source_requirements):
-                    html += f"""
-                                                <span class="requirement"><strong>{req_id}:</strong> {req_text}</span>
+                    yield f"""
+                                                <span class="requirement"><strong>{escape(str(req_id))}:</strong> {escape(str(req_text))}</span>
 """
-                html += """
+                yield """
                                             </div>
 """
             
             # Field reasoning
             if field_reasoning:
-                html += f"""
+                yield f"""
                                             <div class="reasoning-section" style="margin-top: 15px;">
                                                 <div class="reasoning-title">Why this field?</div>
-                                                <div class="reasoning-text">{field_reasoning.get('reason', 'N/A')}</div>
+                                                <div class="reasoning-text">{escape(field_reasoning.get('reason') or 'N/A')}</div>
                                                 <div class="brd-reference">
                                                     <div class="brd-reference-title">BRD Reference:</div>
-                                                    <div class="brd-reference-text">"{field_reasoning.get('brdReference', 'N/A')}"</div>
+                                                    <div class="brd-reference-text">"{escape(field_reasoning.get('brdReference') or 'N/A')}"</div>
                                                 </div>
                                                 <div style="margin-top: 10px;">
-                                                    <strong>Type:</strong> {field_reasoning.get('inferredOrExplicit', 'N/A').title()} | 
-                                                    <strong>OOTB/Custom:</strong> {field_reasoning.get('ootbVsCustom', 'N/A')}
+                                                    <strong>Type:</strong> {escape((field_reasoning.get('inferredOrExplicit') or 'N/A').title())} | 
+                                                    <strong>OOTB/Custom:</strong> {escape(field_reasoning.get('ootbVsCustom') or 'N/A')}
                                                 </div>
                                             </div>
 """
             
-            html += """
+            yield """
                                         </td>
                                     </tr>
 """
         
-        html += """
+        yield """
                                 </tbody>
                             </table>
                         </div>
@@ -1028,32 +1123,20 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
 """
     
     # Reference entities
-    reference_entities = [e for e in entities if e.get('type') == 'ReferenceEntity']
-    
     if reference_entities:
-        html += """
+        yield """
                     <h2 class="section-title" style="margin-top: 50px;">📚 Reference Entities (Lookups)</h2>
 """
         
         for entity in reference_entities:
-            entity_name = entity.get('name', 'Entity')
-            entity_description = entity.get('description', 'No description provided')
-            fields = entity.get('fields', [])
+            entity_name = entity['name']
+            entity_description = escape(entity.get('description') or 'No description provided')
+            fields = entity['fields']
             
-            html += f"""
-                    <div class="entity-card" data-entity-name="{entity_name.lower()}">
-                        <div class="entity-header" onclick="toggleEntity(this)" style="background: #28a745;">
-                            <h3>
-                                {entity_name}
-                                <span class="entity-type-badge">Reference Entity</span>
-                            </h3>
-                            <span class="toggle-icon">▼</span>
-                        </div>
-                        <div class="entity-body">
-                            <div class="entity-description">
-                                {entity_description}
-                            </div>
-                            <table>
+            yield _entity_card_open(
+                entity_name, 'Reference Entity', entity_description,
+                header_style=' style="background: #28a745;"')
+            yield """                            <table>
                                 <thead>
                                     <tr>
                                         <th>Field Name</th>
@@ -1065,72 +1148,26 @@ def generate_html_report(data_model: Dict, output_path: str = "data_model_report
 """
             
             for field in fields:
-                field_name = field.get('name', 'field')
-                data_type = field.get('dataType', 'N/A')
-                description = field.get('description', '')
+                field_name = field['name']
+                data_type = _escape_cached(field.get('dataType') or 'N/A')
+                description = escape(field.get('description') or '')
                 
-                html += f"""
+                yield f"""
                                     <tr>
-                                        <td class="field-name">{field_name}</td>
+                                        <td class="field-name">{escape(field_name)}</td>
                                         <td>{data_type}</td>
                                         <td>{description}</td>
                                     </tr>
 """
             
-            html += """
+            yield """
                                 </tbody>
                             </table>
                         </div>
                     </div>
 """
     
-    html += """
-                </div>
-                <div id="noResults" class="no-results" style="display: none;">
-                    No entities or fields match your search.
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        function toggleEntity(header) {
-            const card = header.parentElement;
-            card.classList.toggle('collapsed');
-        }
-        
-        function filterEntities() {
-            const searchTerm = document.getElementById('searchBox').value.toLowerCase();
-            const entities = document.querySelectorAll('.entity-card');
-            let visibleCount = 0;
-            
-            entities.forEach(entity => {
-                const entityName = entity.getAttribute('data-entity-name');
-                const text = entity.textContent.toLowerCase();
-                
-                if (text.includes(searchTerm)) {
-                    entity.style.display = 'block';
-                    visibleCount++;
-                } else {
-                    entity.style.display = 'none';
-                }
-            });
-            
-            document.getElementById('noResults').style.display = visibleCount === 0 ? 'block' : 'none';
-        }
-    </script>
-</body>
-</html>
-"""
-    
-    # Save to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    print(f"✅ HTML report saved to: {output_path}")
-    print(f"📄 Open this file in your browser to view the report")
-    
-    return html
+    yield _REPORT_FOOTER
 
 
 def get_summary_stats(data_model: Dict) -> Dict:
@@ -1144,23 +1181,37 @@ def get_summary_stats(data_model: Dict) -> Dict:
         Dictionary with stats
     """
     
-    entities = data_model.get('dataModel', {}).get('entities', [])
-    
-    business_entities = [e for e in entities if e.get('type') == 'BusinessEntity']
-    reference_entities = [e for e in entities if e.get('type') == 'ReferenceEntity']
-    
-    total_fields = sum(len(e.get('fields', [])) for e in entities)
-    custom_fields = sum(
-        sum(1 for f in e.get('fields', []) if f.get('isCustom', False))
-        for e in entities
-    )
+    # Resolve the inner container once; the `or` fallbacks reuse singleton
+    # empties instead of allocating a fresh default per lookup
+    inner_model = data_model.get('dataModel') or {}
+    entities = inner_model.get('entities') or ()
+
+    # Categorize entity types in one pass; only the counts are needed, so
+    # no intermediate filtered lists either
+    business_entities = 0
+    reference_entities = 0
+    for e in entities:
+        entity_type = e.get('type')
+        if entity_type == 'BusinessEntity':
+            business_entities += 1
+        elif entity_type == 'ReferenceEntity':
+            reference_entities += 1
+
+    # One flattened walk over every field counts both totals, instead of
+    # separate nested passes per statistic
+    total_fields = 0
+    custom_fields = 0
+    for f in chain.from_iterable(e['fields'] for e in entities):
+        total_fields += 1
+        if f.get('isCustom', False):
+            custom_fields += 1
     
     return {
         'total_entities': len(entities),
-        'business_entities': len(business_entities),
-        'reference_entities': len(reference_entities),
+        'business_entities': business_entities,
+        'reference_entities': reference_entities,
         'total_fields': total_fields,
         'custom_fields': custom_fields,
         'ootb_fields': total_fields - custom_fields,
-        'total_relationships': len(data_model.get('dataModel', {}).get('relationships', []))
+        'total_relationships': len(inner_model.get('relationships') or ())
     }
\ No newline at end of file
@@ -2,16 +2,31 @@
 Simple Excel parser - extracts all text from all sheets
 """
 
+import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 
-def parse_document(file) -> str:
+# Workbooks with at least this many sheets get their per-sheet formatting
+# fanned out across threads; below it the pool overhead outweighs the win
+_PARALLEL_FORMAT_MIN_SHEETS = 4
+
+
+def _format_sheet(df) -> str:
+    """Render one sheet's cells as text ('' for empty sheets)"""
+    return '' if df.empty else df.to_string(index=False)
+
+
+def parse_document(file, max_chars=None) -> str:
     """
     Extract all text from Excel file (all sheets, all cells)
     
     Args:
         file: Uploaded Excel file object (from Streamlit)
+        max_chars: Optional cap on extracted length; sheets are parsed
+                   lazily and processing stops once the cap is reached,
+                   so oversized workbooks are never fully parsed
     
     Returns:
         str: All text content from all sheets
@@ -20,15 +35,34 @@ def parse_document(file) -> str:
         Exception: If file cannot be parsed
     """
     try:
-        # Read all sheets
-        excel_data = pd.read_excel(file, sheet_name=None, engine='openpyxl')
-        
+        # read_only mode streams cells instead of building the full
+        # style/formatting object tree, which is dramatically faster and
+        # lighter for the values-only extraction done here
+        with pd.ExcelFile(file, engine='openpyxl',
+                          engine_kwargs={'read_only': True}) as xl:
+            if max_chars is not None:
+                return _parse_capped(xl, max_chars)
+
+            excel_data = {name: xl.parse(name) for name in xl.sheet_names}
+
+            # Format each sheet independently - concurrently on multi-sheet
+            # workbooks, since the pandas/numpy formatting work releases the
+            # GIL in its C-level stretches and the sheets share no state
+            workers = os.cpu_count() or 1
+            if len(excel_data) >= _PARALLEL_FORMAT_MIN_SHEETS and workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    bodies = list(executor.map(_format_sheet, excel_data.values()))
+            else:
+                bodies = [_format_sheet(df) for df in excel_data.values()]
+
         all_text = []
-        
-        # Process each sheet
-        for sheet_name, df in excel_data.items():
+
+        # Assemble in workbook order; empty sheets (cover pages,
+        # placeholders) contribute their header only
+        for sheet_name, body in zip(excel_data, bodies):
             all_text.append(f"\n=== {sheet_name} ===\n")
-            all_text.append(df.to_string(index=False))
+            if body:
+                all_text.append(body)
         
         return "\n".join(all_text)
         
@@ -36,6 +70,26 @@ def parse_document(file) -> str:
         raise Exception(f"Error parsing Excel file: {str(e)}")
 
 
+def _parse_capped(xl, max_chars):
+    """Extract sheet text until max_chars is reached, one sheet at a time"""
+    all_text = []
+    total = 0
+    for sheet_name in xl.sheet_names:
+        header = f"\n=== {sheet_name} ===\n"
+        all_text.append(header)
+        total += len(header)
+
+        body = _format_sheet(xl.parse(sheet_name))
+        if body:
+            all_text.append(body)
+            total += len(body)
+
+        if total >= max_chars:
+            break
+
+    return "\n".join(all_text)[:max_chars]
+
+
 def get_document_stats(text: str) -> Dict:
     """
     Get statistics about extracted text
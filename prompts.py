@@ -6,6 +6,8 @@ Date: January 2026
 Version: 2.0 - Rebuilt from scratch
 """
 
+import functools
+
 INFORMATICA_SYSTEM_PROMPT = """
 You are an expert Informatica MDM data architect with 15+ years of experience.
 
@@ -395,9 +397,14 @@ def load_person_fields_catalog():
     return ""
 
 
+@functools.lru_cache(maxsize=32)
 def build_enhanced_prompt(frd_text: str, platform: str = "informatica") -> tuple:
     """
     Build prompt with complete Person entity field catalog
+
+    Memoized on (frd_text, platform): re-runs and retries over the same FRD
+    reuse the assembled prompt halves instead of re-reading the catalog and
+    re-building the user prompt.
     
     Args:
         frd_text: Extracted FRD text content
@@ -5,11 +5,12 @@ Each step is a separate, reusable function that Cursor can call independently.
 This allows for iterative refinement and selective re-execution of specific steps.
 """
 
+import hashlib
+import io
 import os
 import sys
 import glob
 from pathlib import Path
-from parsers import parse_document
 from cursor_workflow import save_prompt_to_file, parse_cursor_response
 from generators import save_drawio_file, generate_html_report
 
@@ -113,12 +114,30 @@ def step1_parse_brd(brd_file_path=None):
     
     # Parse FRD
     try:
-        with open(brd_file_path, 'rb') as f:
-            brd_text = parse_document(f)
-        
+        # Extraction is deterministic given the file bytes, so cache the
+        # result keyed by a content digest - re-running on an unchanged FRD
+        # skips the workbook parse entirely (BLAKE2b hashes roughly twice as
+        # fast as SHA-256)
+        brd_bytes = Path(brd_file_path).read_bytes()
+        digest = hashlib.blake2b(brd_bytes, digest_size=16).hexdigest()
+        cache_path = Path("outputs") / f".parse_cache_{digest}.txt"
+
+        if cache_path.exists():
+            brd_text = cache_path.read_text(encoding='utf-8')
+            print("✅ Reusing cached extraction (FRD unchanged)")
+        else:
+            # Imported here so --visuals-only runs never pay the
+            # pandas/openpyxl import cost
+            from parsers import parse_document
+
+            brd_text = parse_document(io.BytesIO(brd_bytes))
+            cache_path.write_text(brd_text, encoding='utf-8')
+
+        char_count = len(brd_text)
+        word_count = len(brd_text.split())
         print(f"✅ Successfully parsed FRD")
-        print(f"   📊 Extracted {len(brd_text):,} characters")
-        print(f"   📊 Approximately {len(brd_text.split()):,} words")
+        print(f"   📊 Extracted {char_count:,} characters")
+        print(f"   📊 Approximately {word_count:,} words")
         print()
         
         return brd_text, outputs
@@ -180,21 +199,26 @@ def step3_cursor_instructions(outputs):
     Returns:
         str: JSON output path
     """
-    print("=" * 70)
-    print("STEP 3: Give prompt to AI → execute → JSON")
-    print("=" * 70)
-    print("📋 The prompt file contains: parse output (FRD) + prompts.py + OOTB reference.")
-    print("   The AI must receive this prompt, execute it, and output JSON.")
-    print()
-    print("   Give this prompt to Cursor AI:")
-    print(f"   1. Read: {outputs['prompt']}")
-    print(f"   2. Generate the data model JSON following the prompt")
-    print(f"   3. Save the JSON to: {outputs['json']}")
-    print()
-    print("💡 Say to Cursor:")
-    print(f"   'Read {outputs['prompt']} and generate the data model JSON.'")
-    print(f"   'Save the JSON to {outputs['json']}'")
-    print()
+    # One buffered write instead of a dozen print calls, each of which
+    # would acquire the stdout lock and flush on its newline
+    banner = "=" * 70
+    sys.stdout.write(
+        f"{banner}\n"
+        "STEP 3: Give prompt to AI → execute → JSON\n"
+        f"{banner}\n"
+        "📋 The prompt file contains: parse output (FRD) + prompts.py + OOTB reference.\n"
+        "   The AI must receive this prompt, execute it, and output JSON.\n"
+        "\n"
+        "   Give this prompt to Cursor AI:\n"
+        f"   1. Read: {outputs['prompt']}\n"
+        "   2. Generate the data model JSON following the prompt\n"
+        f"   3. Save the JSON to: {outputs['json']}\n"
+        "\n"
+        "💡 Say to Cursor:\n"
+        f"   'Read {outputs['prompt']} and generate the data model JSON.'\n"
+        f"   'Save the JSON to {outputs['json']}'\n"
+        "\n"
+    )
     return outputs['json']
 
 
@@ -315,15 +339,18 @@ def run_full_pipeline(brd_file_path=None):
         print("✅ Found existing JSON response!")
         drawio, html = step4_generate_visualizations(json_path, outputs)
         if drawio and html:
-            print("=" * 70)
-            print("✅ PIPELINE COMPLETE!")
-            print("=" * 70)
-            print("\n📁 Generated Files:")
-            print(f"   1. {outputs['prompt']} - Cursor prompt")
-            print(f"   2. {json_path} - Data model JSON")
-            print(f"   3. {drawio} - Draw.io diagram")
-            print(f"   4. {html} - HTML report")
-            print("\n🎉 Open the HTML report in your browser to view the data model!")
+            banner = "=" * 70
+            sys.stdout.write(
+                f"{banner}\n"
+                "✅ PIPELINE COMPLETE!\n"
+                f"{banner}\n"
+                "\n📁 Generated Files:\n"
+                f"   1. {outputs['prompt']} - Cursor prompt\n"
+                f"   2. {json_path} - Data model JSON\n"
+                f"   3. {drawio} - Draw.io diagram\n"
+                f"   4. {html} - HTML report\n"
+                "\n🎉 Open the HTML report in your browser to view the data model!\n"
+            )
             return True
     else:
         print("\n⏳ Waiting for Cursor to generate JSON...")